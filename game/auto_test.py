@@ -218,6 +218,9 @@ class AutoTestGame:
         # Network updates
         self._process_network()
 
+        # Move projectiles
+        self.projectile_manager.tick(time.dt)
+
         # Collision detection (host only)
         if self.is_host:
             self._check_collisions()
@@ -372,9 +375,9 @@ class AutoTestGame:
         hits = self.projectile_manager.check_collisions(all_players, bounds)
 
         for hit in hits:
-            target_id = hit['target_id']
-            attacker_id = hit['attacker_id']
-            damage = hit['damage']
+            target_id = hit.target_id
+            attacker_id = hit.attacker_id
+            damage = hit.damage
 
             if target_id == self.local_player.player_id:
                 died = self.local_player.take_damage(damage, attacker_id)
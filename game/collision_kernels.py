@@ -0,0 +1,146 @@
+"""Batch collision kernels over the projectile flight arrays.
+
+Numba is optional. When it is installed the kernels are compiled to fused
+native loops; otherwise the NumPy versions are used.
+"""
+import numpy as np
+
+try:
+    from numba import njit, prange
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+
+def _sweep_pairs_numpy(origin, delta, radius, obs_min, obs_max, proj_idx, obs_idx):
+    """Slab test of each (segment, AABB) pair, gathered into (Q, 3) rows."""
+    r = radius[proj_idx][:, None]
+    lo = obs_min[obs_idx] - r
+    hi = obs_max[obs_idx] + r
+    o = origin[proj_idx]
+    d = delta[proj_idx]
+
+    parallel = np.abs(d) < 1e-9
+    inv = 1.0 / np.where(parallel, 1.0, d)
+    t0 = (lo - o) * inv
+    t1 = (hi - o) * inv
+    near = np.minimum(t0, t1)
+    far = np.maximum(t0, t1)
+
+    # Parallel to a slab - either always inside it or never
+    inside = (o >= lo) & (o <= hi)
+    near = np.where(parallel, np.where(inside, -np.inf, np.inf), near)
+    far = np.where(parallel, np.where(inside, np.inf, -np.inf), far)
+
+    t_enter = np.maximum(near.max(axis=1), 0.0)
+    t_exit = np.minimum(far.min(axis=1), 1.0)
+    return np.where(t_enter <= t_exit, t_enter, np.inf)
+
+
+if NUMBA_AVAILABLE:
+    @njit(cache=True, parallel=True)
+    def _sweep_pairs_numba(origin, delta, radius, obs_min, obs_max, proj_idx, obs_idx):
+        """Same slab test as the NumPy version, without gathered temporaries."""
+        count = proj_idx.shape[0]
+        out = np.full(count, np.inf)
+        for q in prange(count):
+            i = proj_idx[q]
+            j = obs_idx[q]
+            r = radius[i]
+            t_enter = 0.0
+            t_exit = 1.0
+            hit = True
+            for k in range(3):
+                o = origin[i, k]
+                d = delta[i, k]
+                lo = obs_min[j, k] - r
+                hi = obs_max[j, k] + r
+                if abs(d) < 1e-9:
+                    if o < lo or o > hi:
+                        hit = False
+                        break
+                    continue
+                t0 = (lo - o) / d
+                t1 = (hi - o) / d
+                if t0 > t1:
+                    t0, t1 = t1, t0
+                if t0 > t_enter:
+                    t_enter = t0
+                if t1 < t_exit:
+                    t_exit = t1
+                if t_enter > t_exit:
+                    hit = False
+                    break
+            if hit:
+                out[q] = t_enter
+        return out
+
+    # No fastmath: with float64 player arrays this is the exact test
+    # check_collisions runs in Python, so both agree on borderline hits
+    @njit(cache=True, parallel=True)
+    def _first_player_hits_numba(proj_pos, proj_bonus, proj_owner,
+                                 player_pos, player_radius, player_ids):
+        """Index of the first non-owner player each projectile touches, or -1."""
+        count = proj_pos.shape[0]
+        out = np.full(count, -1, dtype=np.int64)
+        for i in prange(count):
+            for j in range(player_pos.shape[0]):
+                if player_ids[j] == proj_owner[i]:
+                    continue
+                dx = player_pos[j, 0] - proj_pos[i, 0]
+                dy = player_pos[j, 1] - proj_pos[i, 1]
+                dz = player_pos[j, 2] - proj_pos[i, 2]
+                reach = player_radius[j] + proj_bonus[i]
+                if dx * dx + dy * dy + dz * dz < reach * reach:
+                    out[i] = j
+                    break
+        return out
+
+
+def sweep_aabbs(origin, delta, radius, obs_min, obs_max, proj_idx, obs_idx):
+    """Sweep segments origin + t*delta (t in [0, 1]) against candidate AABBs.
+
+    origin/delta: (P, 3) float arrays, radius: (P,) projectile radii that grow
+    each box, obs_min/obs_max: (M, 3) box corners. proj_idx/obs_idx: (Q,) int
+    arrays listing the (segment, box) pairs to test, e.g. from a broad phase.
+    Returns a (P,) array with the earliest entry time per segment (0 if it
+    starts inside a box), or inf on a miss.
+    """
+    t_hit = np.full(len(origin), np.inf)
+    if not len(proj_idx):
+        return t_hit
+    if NUMBA_AVAILABLE:
+        t_pair = _sweep_pairs_numba(origin, delta, radius, obs_min, obs_max, proj_idx, obs_idx)
+    else:
+        t_pair = _sweep_pairs_numpy(origin, delta, radius, obs_min, obs_max, proj_idx, obs_idx)
+    np.minimum.at(t_hit, proj_idx, t_pair)
+    return t_hit
+
+
+def first_player_hits(proj_pos, proj_bonus, proj_owner, player_pos, player_radius, player_ids):
+    """Find the first player (in array order) each projectile is touching.
+
+    proj_pos: (P, 3), proj_bonus: (P,) extra hit radius, proj_owner: (P,) owner
+    ids. player_pos: (K, 3) and player_radius: (K,) as float64, player_ids: (K,).
+    Returns a (P,) int array of player indices, -1 where nothing was hit.
+    Requires Numba; without it callers use their own broad phase.
+    """
+    return _first_player_hits_numba(
+        proj_pos, proj_bonus, proj_owner, player_pos, player_radius, player_ids
+    )
+
+
+def warm_up():
+    """Compile the Numba kernels up front with tiny dummy arrays.
+
+    Numba compiles on first call, which would otherwise stall the first frame
+    a projectile is in flight. The dtypes match what ProjectileManager passes,
+    so the real calls reuse these specializations. No-op without Numba.
+    """
+    if not NUMBA_AVAILABLE:
+        return
+    xyz = np.zeros((1, 3), dtype=np.float32)
+    one = np.zeros(1, dtype=np.float32)
+    idx = np.zeros(1, dtype=np.int64)
+    sweep_aabbs(xyz, xyz, one, xyz, xyz, idx, idx)
+    first_player_hits(xyz, one, idx, np.zeros((1, 3)), np.zeros(1), idx)
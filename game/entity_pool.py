@@ -0,0 +1,40 @@
+"""Free-list pooling for short-lived Ursina entities."""
+from ursina import destroy
+
+
+class EntityPool:
+    """Recycles disabled entities instead of destroying and re-creating them."""
+
+    def __init__(self, factory, reset_fn=None, on_release=None):
+        self.factory = factory
+        self.reset_fn = reset_fn
+        self.on_release = on_release
+        self.free = []  # Stack of disabled entities ready for reuse
+
+    def prefill(self, count):
+        """Build entities up front so the first bursts don't allocate."""
+        for _ in range(count - len(self.free)):
+            ent = self.factory()
+            ent.enabled = False
+            self.free.append(ent)
+
+    def acquire(self, **kwargs):
+        """Pop a free entity (or build a new one), reset it and enable it."""
+        ent = self.free.pop() if self.free else self.factory()
+        if self.reset_fn:
+            self.reset_fn(ent, **kwargs)
+        ent.enabled = True
+        return ent
+
+    def release(self, ent):
+        """Disable an entity and push it back onto the free list."""
+        ent.enabled = False
+        if self.on_release:
+            self.on_release(ent)
+        self.free.append(ent)
+
+    def clear(self):
+        """Destroy all pooled entities."""
+        for ent in self.free:
+            destroy(ent)
+        self.free.clear()
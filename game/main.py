@@ -280,7 +280,7 @@ class Game:
         print(f"[LOG] {len(self.collidables)} collidable obstacles registered")
 
         # Set collidables on projectile manager
-        self.projectile_manager.set_collidables(self.collidables)
+        self.projectile_manager.set_collidables(self.collidables, self.arena.get_bounds())
 
         # Create local player - spawn in corners away from central tunnels
         if player_id == 0:
@@ -432,15 +432,15 @@ class Game:
 
         shot_data = self.local_player.shoot_spreadshot()
 
-        # Spawn 3 projectiles from each weapon pod (6 total)
+        # Spawn 3 projectiles from each weapon pod (6 total) as one volley
+        directions = shot_data["directions"]
+        self.projectile_manager.spawn_many(
+            [pod_pos for pod_pos in shot_data["positions"] for _ in directions],
+            directions * len(shot_data["positions"]),
+            owner_id=shot_data["owner_id"],
+            weapon='spreadshot'
+        )
         for pod_pos in shot_data["positions"]:
-            for direction in shot_data["directions"]:
-                self.projectile_manager.spawn(
-                    position=pod_pos,
-                    direction=direction,
-                    owner_id=shot_data["owner_id"],
-                    weapon='spreadshot'
-                )
             # Muzzle flash at each pod
             self.particle_manager.create_muzzle_flash(
                 pod_pos,
@@ -545,6 +545,9 @@ class Game:
         # Network updates
         self._process_network()
 
+        # Move projectiles (one clock read per frame for all of them)
+        self.projectile_manager.tick(time.dt)
+
         # Check projectile collisions (host authoritative)
         if self.is_host:
             self._check_collisions()
@@ -649,7 +652,16 @@ class Game:
             owner_id = proj.get("owner_id")
 
             # Don't duplicate our own projectiles
-            if owner_id != self.local_player.player_id:
+            if owner_id != self.local_player.player_id and "positions" in proj:
+                # Spread volley - every direction from every pod
+                directions = proj.get("directions", [])
+                self.projectile_manager.spawn_many(
+                    [pod_pos for pod_pos in proj["positions"] for _ in directions],
+                    directions * len(proj["positions"]),
+                    owner_id=owner_id,
+                    weapon=proj.get("weapon", "spreadshot"),
+                )
+            elif owner_id != self.local_player.player_id:
                 self.projectile_manager.spawn(
                     position=proj.get("position", (0, 0, 0)),
                     direction=proj.get("direction", (0, 0, 1)),
@@ -738,20 +750,17 @@ class Game:
 
         # Process player hits
         for hit in hits:
-            target_id = hit["target_id"]
-            attacker_id = hit["attacker_id"]
-            damage = hit["damage"]
+            target_id = hit.target_id
+            attacker_id = hit.attacker_id
+            damage = hit.damage
 
             # Play hit/explosion sounds and create particle effects
             if damage >= 40:  # Secondary weapon = explosion
                 self.play_sfx('explosion')
-                # Get hit position from the hit data if available
-                hit_pos = hit.get('position', self.local_player.position if target_id == self.local_player.player_id else Vec3(0, 0, 0))
-                self.particle_manager.create_explosion(hit_pos, 'large')
+                self.particle_manager.create_explosion(hit.position, 'large')
             else:
                 self.play_sfx('hit')
-                hit_pos = hit.get('position', Vec3(0, 0, 0))
-                self.particle_manager.create_explosion(hit_pos, 'small')
+                self.particle_manager.create_explosion(hit.position, 'small')
 
             # Apply damage
             if target_id == self.local_player.player_id:
@@ -835,8 +844,12 @@ class Game:
             for obs in self.arena.obstacles:
                 destroy(obs)
             self.arena = None
+            self.collidables = []
 
         self.projectile_manager.clear()
+        self.projectile_manager.destroy_pools()
+        # Drop the cached obstacle bounds along with the arena
+        self.projectile_manager.set_collidables([])
 
         if hasattr(self, 'powerup_spawner') and self.powerup_spawner:
             self.powerup_spawner.cleanup()
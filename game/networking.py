@@ -31,6 +31,7 @@ class NetworkServer:
         self.next_player_id = 1  # 0 is reserved for host
         self.message_queue = []
         self.lock = threading.Lock()
+        self.message_ready = threading.Condition(self.lock)
         self.projectile_id_counter = 0
 
     def start(self):
@@ -72,6 +73,7 @@ class NetworkServer:
 
                 with self.lock:
                     self._handle_message(message, addr)
+                    self.message_ready.notify_all()
             except socket.timeout:
                 continue
             except Exception as e:
@@ -238,6 +240,16 @@ class NetworkServer:
             self.message_queue.clear()
         return messages
 
+    def wait_for_message(self, msg_type, timeout=1.0):
+        """Block until a msg_type message is queued (or timeout), then get and clear the queue."""
+        with self.message_ready:
+            self.message_ready.wait_for(
+                lambda: any(m.get('type') == msg_type for m in self.message_queue), timeout
+            )
+            messages = self.message_queue.copy()
+            self.message_queue.clear()
+        return messages
+
     def get_client_count(self):
         """Get number of connected clients."""
         return len(self.clients)
@@ -253,6 +265,7 @@ class NetworkClient:
         self.player_id = None
         self.message_queue = []
         self.lock = threading.Lock()
+        self.message_ready = threading.Condition(self.lock)
         self.connected = False
 
     def connect(self, host_ip, port=5555, timeout=5.0):
@@ -299,6 +312,7 @@ class NetworkClient:
 
                 with self.lock:
                     self._handle_message(message)
+                    self.message_ready.notify_all()
             except socket.timeout:
                 continue
             except Exception as e:
@@ -390,6 +404,16 @@ class NetworkClient:
             self.message_queue.clear()
         return messages
 
+    def wait_for_message(self, msg_type, timeout=1.0):
+        """Block until a msg_type message is queued (or timeout), then get and clear the queue."""
+        with self.message_ready:
+            self.message_ready.wait_for(
+                lambda: any(m.get('type') == msg_type for m in self.message_queue), timeout
+            )
+            messages = self.message_queue.copy()
+            self.message_queue.clear()
+        return messages
+
 
 def get_local_ip():
     """Get the local IP address for LAN."""
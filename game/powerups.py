@@ -4,6 +4,21 @@ import random
 import math
 
 
+# One period of sine sampled for the bob/pulse animations
+_SIN_LUT_SIZE = 1024  # Power of two so wrapping is a bit mask
+_SIN_LUT = [math.sin(i * 2 * math.pi / _SIN_LUT_SIZE) for i in range(_SIN_LUT_SIZE)]
+_SIN_LUT_SCALE = _SIN_LUT_SIZE / (2 * math.pi)
+
+
+# Beyond this distance from the camera the spin is not noticeable
+_SPIN_DISTANCE_SQ = 100.0 * 100.0
+
+
+def _fast_sin(angle):
+    """Table-lookup sine, accurate enough for cosmetic animation."""
+    return _SIN_LUT[int(angle * _SIN_LUT_SCALE) & (_SIN_LUT_SIZE - 1)]
+
+
 class PowerUp(Entity):
     """Base class for collectible power-ups."""
 
@@ -77,16 +92,21 @@ class PowerUp(Entity):
         if not self.active:
             return
 
-        # Rotate
-        self.rotation_y += 60 * time.dt
-        self.rotation_x += 30 * time.dt
+        now = time.time()
+        dt = time.dt
+
+        # Rotate - skipped when too far away to see it
+        offset = self.position - camera.world_position
+        if offset.x * offset.x + offset.y * offset.y + offset.z * offset.z < _SPIN_DISTANCE_SQ:
+            self.rotation_y += 60 * dt
+            self.rotation_x += 30 * dt
 
         # Bob up and down
-        bob = math.sin(time.time() * 2 + self.bob_offset) * 0.3
+        bob = _fast_sin(now * 2 + self.bob_offset) * 0.3
         self.y = self.spawn_position.y + bob
 
         # Pulse glow
-        pulse = (math.sin(time.time() * 4) + 1) / 2
+        pulse = (_fast_sin(now * 4) + 1) / 2
         self.glow.scale = 0.5 + pulse * 0.3
 
     def collect(self, player):
@@ -129,6 +149,7 @@ class PowerUpSpawner:
         self.powerups = {}  # id -> PowerUp
         self.respawn_queue = []  # (respawn_time, type, position, id)
         self.next_id = 0
+        self._now = time.time()  # Clock cached by update()
 
         # Spawn initial power-ups
         self._create_spawn_points()
@@ -186,6 +207,7 @@ class PowerUpSpawner:
     def update(self):
         """Update respawn timers."""
         current_time = time.time()
+        self._now = current_time
 
         # Check respawn queue
         new_queue = []
@@ -201,21 +223,23 @@ class PowerUpSpawner:
     def check_collection(self, player):
         """Check if player collected any power-ups."""
         collected = []
+        taken = []
         player_pos = player.position
-        collection_radius = 3.0
+        collection_radius_sq = 3.0 * 3.0
 
-        for powerup_id, powerup in list(self.powerups.items()):
+        # Deletions are deferred to taken, so iterating the live dict is safe
+        for powerup_id, powerup in self.powerups.items():
             if not powerup.active:
                 continue
 
-            distance = (powerup.position - player_pos).length()
-            if distance < collection_radius:
+            offset = powerup.position - player_pos
+            if offset.x * offset.x + offset.y * offset.y + offset.z * offset.z < collection_radius_sq:
                 effect = powerup.collect(player)
                 if effect:
                     collected.append(effect)
 
                     # Queue respawn
-                    respawn_time = time.time() + powerup.type_data['respawn_time']
+                    respawn_time = self._now + powerup.type_data['respawn_time']
                     self.respawn_queue.append((
                         respawn_time,
                         powerup.powerup_type,
@@ -223,9 +247,11 @@ class PowerUpSpawner:
                         powerup_id
                     ))
 
-                # Remove from active powerups
-                if powerup_id in self.powerups:
-                    del self.powerups[powerup_id]
+                taken.append(powerup_id)
+
+        # Remove from active powerups
+        for powerup_id in taken:
+            del self.powerups[powerup_id]
 
         return collected
 
@@ -273,14 +299,15 @@ class PowerUpEffect:
     def update(self):
         """Update the effect."""
         if self.duration > 0:
-            elapsed = time.time() - self.start_time
+            now = time.time()
+            elapsed = now - self.start_time
             if elapsed >= self.duration:
                 self.active = False
                 destroy(self.effect_entity)
                 return False
 
             # Pulse effect
-            pulse = (math.sin(time.time() * 4) + 1) / 2
+            pulse = (_fast_sin(now * 4) + 1) / 2
             self.effect_entity.scale = 2 + pulse * 0.5
 
         return True
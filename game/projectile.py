@@ -1,65 +1,119 @@
 """Projectile/bullet handling with primary and secondary weapons."""
 from ursina import *
-import random
+import math
+from collections import namedtuple
+import numpy as np
+from entity_pool import EntityPool
+from collision_kernels import NUMBA_AVAILABLE, first_player_hits, sweep_aabbs, warm_up
+
+
+# One damage event from check_collisions; weapon is 'splash' for blast damage
+HitRecord = namedtuple(
+    'HitRecord', 'projectile_id target_id attacker_id damage weapon position'
+)
+
+
+# Per-weapon style: (color, scale, model, collider, trail_scale, trail_color)
+_WEAPON_STYLE = {
+    'secondary': (
+        Color(255/255, 100/255, 50/255, 1),   # Orange-red
+        (2.0, 2.0, 2.0),                      # 4x bigger
+        'sphere',
+        'sphere',
+        (1.2, 1.2, 4.8),                      # 4x bigger trail
+        Color(255/255, 150/255, 50/255, 1),
+    ),
+    'spreadshot': (
+        Color(150/255, 200/255, 255/255, 1),  # Light blue
+        (0.12, 0.12, 0.12),
+        'sphere',
+        'sphere',
+        (0.06, 0.06, 0.3),
+        Color(100/255, 150/255, 255/255, 1),
+    ),
+    # Primary laser - long thick beam (3x bigger)
+    'primary': (
+        Color(100/255, 255/255, 150/255, 1),  # Bright green laser
+        (1.05, 1.05, 9.0),                    # 3x thicker and longer
+        'cube',
+        'box',
+        (0.75, 0.75, 4.5),
+        Color(150/255, 200/255, 80/255, 1),
+    ),
+}
+_DEFAULT_STYLE = _WEAPON_STYLE['primary']
+
+# Explosion and debris colors, shared by every effect instead of rebuilt each time
+_EXPLOSION_FLASH = Color(255/255, 200/255, 50/255, 1)
+_EXPLOSION_GLOW = Color(255/255, 100/255, 30/255, 1)
+_EXPLOSION_FADE = Color(255/255, 50/255, 20/255, 0)
+_DEBRIS_FADE = color.rgba(255, 100, 50, 0)
+_DEBRIS_COLORS = {}  # Green channel (0-255) -> debris Color, filled on first use
+
+
+def _debris_color(green):
+    """Shared orange debris Color for a green channel value."""
+    debris_color = _DEBRIS_COLORS.get(green)
+    if debris_color is None:
+        debris_color = _DEBRIS_COLORS[green] = Color(255/255, green/255, 50/255, 1)
+    return debris_color
+
+
+# Per-weapon stats: (speed, damage, lifetime)
+_WEAPON_STATS = {
+    'secondary': (350, 100, 10.0),   # Faster missile, direct hit kills, long range
+    'spreadshot': (195, 8, 2.0),     # Medium speed, low damage (but 3 projectiles)
+    'primary': (3500, 12, 1.5),      # Ultra fast laser
+}
+
+# Weapons that explode with splash damage on impact
+_EXPLOSIVE_WEAPONS = frozenset({'secondary'})
+
+# Initial number of projectile slots in the manager's flight arrays (grows as needed)
+_INITIAL_CAPACITY = 256
+
+# Debris cubes per explosion, and how many are created up front
+_DEBRIS_PER_EXPLOSION = 8
+_DEBRIS_POOL_SIZE = 64
+
+# Extra hit radius added to the target's collision radius
+_HIT_RADIUS = {
+    'secondary': 2.0,
+    'spreadshot': 1.0,
+    'primary': 1.0,
+}
+
+# Edge length of the uniform grid cells obstacles are bucketed into
+_OBSTACLE_CELL = 200.0
+
+# Secondary splash radius; distance checks compare squared values
+_SPLASH_RADIUS = 15.0
+_SPLASH_RADIUS_SQ = _SPLASH_RADIUS * _SPLASH_RADIUS
 
 
 class Projectile(Entity):
-    """Fast-moving projectile with collision detection."""
-
-    def __init__(self, position, direction, owner_id, projectile_id=0,
-                 speed=60, damage=15, lifetime=3.0, weapon='primary', collidables=None, **kwargs):
-        # Different visuals for each weapon type
-        if weapon == 'secondary':
-            proj_color = Color(255/255, 100/255, 50/255, 1)  # Orange-red
-            proj_scale = (2.0, 2.0, 2.0)  # 4x bigger
-            proj_model = 'sphere'
-            trail_scale = (1.2, 1.2, 4.8)  # 4x bigger trail
-        elif weapon == 'spreadshot':
-            proj_color = Color(150/255, 200/255, 255/255, 1)  # Light blue
-            proj_scale = (0.12, 0.12, 0.12)
-            proj_model = 'sphere'
-            trail_scale = (0.06, 0.06, 0.3)
-        else:
-            # Primary laser - long thick beam (3x bigger)
-            proj_color = Color(100/255, 255/255, 150/255, 1)  # Bright green laser
-            proj_scale = (1.05, 1.05, 9.0)  # 3x thicker and longer
-            proj_model = 'cube'
-            trail_scale = (0.75, 0.75, 4.5)
+    """Rendered projectile; ProjectileManager.tick moves it and tests collisions."""
+
+    def __init__(self, position=(0, 0, 0), direction=(0, 0, 1), owner_id=None, projectile_id=0,
+                 speed=60, damage=15, lifetime=3.0, weapon='primary', pool=None, **kwargs):
+        proj_color, proj_scale, proj_model, proj_collider, trail_scale, trail_color = \
+            _WEAPON_STYLE.get(weapon, _DEFAULT_STYLE)
 
         super().__init__(
             model=proj_model,
             color=proj_color,
             scale=proj_scale,
             position=position,
-            collider='box' if weapon == 'primary' else 'sphere',
+            collider=proj_collider,
             **kwargs
         )
 
-        self.projectile_id = projectile_id
-        self.owner_id = owner_id
-        self.direction = Vec3(direction[0], direction[1], direction[2]).normalized()
-        self.speed = speed
-        self.damage = damage
-        self.lifetime = lifetime
         self.weapon = weapon
-        self.spawn_time = time.time()
-        self.active = True
-        self.collidables = collidables if collidables else []
+        self.pool = pool
+        self.slot = None  # Index into ProjectileManager's flight arrays
         self.proj_radius = proj_scale[0] if isinstance(proj_scale, tuple) else proj_scale * 0.5
-        self.hit_obstacle = False
-        self.hit_position = None
-
-        # Orient projectile to face direction of travel (for elongated shapes)
-        if weapon == 'primary':
-            self.look_at(self.position + self.direction)
 
         # Visual trail effect
-        if weapon == 'secondary':
-            trail_color = Color(255/255, 150/255, 50/255, 1)
-        elif weapon == 'spreadshot':
-            trail_color = Color(100/255, 150/255, 255/255, 1)
-        else:
-            trail_color = Color(150/255, 200/255, 80/255, 1)
         self.trail = Entity(
             parent=self,
             model='cube',
@@ -68,56 +122,35 @@ class Projectile(Entity):
             position=(0, 0, -trail_scale[2] * 0.5)
         )
 
-    def update(self):
-        """Move projectile and check lifetime."""
-        if not self.active:
-            return
-
-        self.position += self.direction * self.speed * time.dt
-
-        # Check collision with obstacles - set flag but don't despawn (let manager handle it)
-        if self._check_obstacle_collision():
-            self.hit_obstacle = True
-            self.hit_position = Vec3(self.position)
-            return
-
-        if time.time() - self.spawn_time > self.lifetime:
-            self.despawn()
-
-    def _check_obstacle_collision(self):
-        """Check if projectile hit an obstacle."""
-        if not self.collidables:
-            return False
-
-        for obstacle in self.collidables:
-            if not obstacle.enabled:
-                continue
-
-            # Get obstacle bounds (AABB)
-            obs_pos = obstacle.world_position
-            obs_scale = obstacle.scale
-
-            # Half extents
-            hx = obs_scale.x / 2
-            hy = obs_scale.y / 2
-            hz = obs_scale.z / 2
-
-            # Find closest point on AABB to projectile
-            closest_x = clamp(self.x, obs_pos.x - hx, obs_pos.x + hx)
-            closest_y = clamp(self.y, obs_pos.y - hy, obs_pos.y + hy)
-            closest_z = clamp(self.z, obs_pos.z - hz, obs_pos.z + hz)
+        self.reinit(position, direction, owner_id, projectile_id, speed, damage, lifetime)
 
-            # Calculate distance from projectile to closest point
-            dx = self.x - closest_x
-            dy = self.y - closest_y
-            dz = self.z - closest_z
-            dist_sq = dx * dx + dy * dy + dz * dz
+    def reinit(self, position, direction, owner_id, projectile_id=0,
+               speed=60, damage=15, lifetime=3.0, normalized=False):
+        """Reset flight state so a pooled projectile can be fired again.
 
-            # Check collision (using projectile radius)
-            if dist_sq < self.proj_radius * self.proj_radius:
-                return True
+        Pass normalized=True when direction is already unit length.
+        """
+        self.position = position
+        self.projectile_id = projectile_id
+        self.owner_id = owner_id
+        # Unit direction as plain floats - Vec3 is reserved for engine calls
+        dx, dy, dz = direction[0], direction[1], direction[2]
+        if not normalized:
+            norm = math.sqrt(dx * dx + dy * dy + dz * dz)
+            if norm > 0:
+                dx, dy, dz = dx / norm, dy / norm, dz / norm
+        self.dir_x, self.dir_y, self.dir_z = dx, dy, dz
+        self.speed = speed
+        self.damage = damage
+        self.lifetime = lifetime
+        self.spawn_time = time.time()
+        self.active = True
+        self.hit_obstacle = False
+        self.hit_position = None
 
-        return False
+        # Orient projectile to face direction of travel (for elongated shapes)
+        if self.weapon == 'primary':
+            self.look_at(Vec3(position[0] + dx, position[1] + dy, position[2] + dz))
 
     def despawn(self, create_explosion=False, hit_obstacle=False):
         """Remove the projectile, optionally with explosion."""
@@ -125,7 +158,10 @@ class Projectile(Entity):
             return
         self.active = False
         self.hit_obstacle = hit_obstacle  # Flag for external code to check
-        destroy(self)
+        if self.pool:
+            self.pool.release(self)
+        else:
+            destroy(self)
 
     def get_state(self):
         """Get state for network sync."""
@@ -133,7 +169,7 @@ class Projectile(Entity):
             'projectile_id': self.projectile_id,
             'owner_id': self.owner_id,
             'position': (self.position.x, self.position.y, self.position.z),
-            'direction': (self.direction.x, self.direction.y, self.direction.z),
+            'direction': (self.dir_x, self.dir_y, self.dir_z),
             'weapon': self.weapon
         }
 
@@ -141,19 +177,11 @@ class Projectile(Entity):
 class Explosion(Entity):
     """Visual explosion effect."""
 
-    def __init__(self, position, size=3.0, duration=0.5, **kwargs):
-        super().__init__(
-            model='sphere',
-            color=Color(255/255, 200/255, 50/255, 1),
-            scale=0.1,
-            position=position,
-            **kwargs
-        )
+    def __init__(self, position=(0, 0, 0), size=3.0, duration=0.5, pool=None, **kwargs):
+        super().__init__(model='sphere', **kwargs)
 
-        self.max_size = size
-        self.duration = duration
-        self.spawn_time = time.time()
-        self.active = True
+        self.pool = pool
+        self._pending = None  # Scheduled fade/cleanup step
 
         # Inner bright core
         self.core = Entity(
@@ -163,23 +191,60 @@ class Explosion(Entity):
             scale=0.6
         )
 
+        self.reinit(position, size, duration)
+
+    def reinit(self, position, size=3.0, duration=0.5):
+        """Restart the explosion at a new position."""
+        # A fresh entity already ran reinit from __init__; drop that schedule
+        # so only one fade/release chain is ever pending
+        if self._pending:
+            self._pending.kill()
+        self.position = position
+        self.color = _EXPLOSION_FLASH
+        self.scale = 0.1
+        self.max_size = size
+        self.duration = duration
+        self.spawn_time = time.time()
+        self.active = True
+
         # Start expansion animation
         self.animate_scale(size, duration=duration * 0.3, curve=curve.out_expo)
-        self.animate_color(Color(255/255, 100/255, 30/255, 1), duration=duration * 0.5)
+        self.animate_color(_EXPLOSION_GLOW, duration=duration * 0.5)
 
         # Schedule fadeout
-        invoke(self._fade_out, delay=duration * 0.3)
+        self._pending = invoke(self._fade_out, delay=duration * 0.3)
 
     def _fade_out(self):
         """Fade out and destroy."""
-        self.animate_color(Color(255/255, 50/255, 20/255, 0), duration=self.duration * 0.7)
+        self.animate_color(_EXPLOSION_FADE, duration=self.duration * 0.7)
         self.animate_scale(self.max_size * 1.5, duration=self.duration * 0.7)
-        invoke(self._destroy, delay=self.duration * 0.7)
+        self._pending = invoke(self._destroy, delay=self.duration * 0.7)
 
     def _destroy(self):
         """Clean up."""
+        if not self.active:
+            return
         self.active = False
-        destroy(self)
+        self._pending = None
+        if self.pool:
+            self.pool.release(self)
+        else:
+            destroy(self)
+
+    def cancel(self):
+        """Stop the explosion early and clean up."""
+        if not self.active:
+            return
+        if self._pending:
+            self._pending.kill()
+        self._destroy()
+
+
+def _reset_debris(debris, position, color, scale):
+    """Reset a pooled debris cube for a new explosion."""
+    debris.position = position
+    debris.color = color
+    debris.scale = scale
 
 
 class ProjectileManager:
@@ -190,32 +255,291 @@ class ProjectileManager:
         self.explosions = []
         self.next_id = 0
         self.collidables = collidables if collidables else []
+        self.arena_bounds = None  # Arena half-extents, when known
+        self.refresh_obstacles()
+        self._now = time.time()  # Clock cached by tick()
+
+        # Flight state as parallel arrays (structure of arrays), packed into
+        # slots [0, _count). Entities are only used for rendering.
+        self._count = 0
+        self._slot_proj = []  # slot -> Projectile
+        # Geometry is single precision; clock values stay float64 since
+        # float32 can't resolve time.time() to better than minutes
+        self._pos = np.zeros((_INITIAL_CAPACITY, 3), dtype=np.float32)
+        self._dir = np.zeros((_INITIAL_CAPACITY, 3), dtype=np.float32)
+        self._speed = np.zeros(_INITIAL_CAPACITY, dtype=np.float32)
+        self._spawn_time = np.zeros(_INITIAL_CAPACITY)
+        self._lifetime = np.zeros(_INITIAL_CAPACITY)
+        self._radius = np.zeros(_INITIAL_CAPACITY, dtype=np.float32)
+        self._hit_bonus = np.zeros(_INITIAL_CAPACITY, dtype=np.float32)
+        self._owner = np.zeros(_INITIAL_CAPACITY, dtype=np.int64)
+
+        # Entity pools - despawned projectiles/effects are recycled, not destroyed
+        self._pools = {
+            weapon: self._make_projectile_pool(weapon)
+            for weapon in ('primary', 'secondary', 'spreadshot')
+        }
+        self._explosion_pool = EntityPool(
+            lambda: Explosion(pool=self._explosion_pool), Explosion.reinit
+        )
+        self._debris_pool = EntityPool(lambda: Entity(model='cube'), _reset_debris)
+        self._debris_pool.prefill(_DEBRIS_POOL_SIZE)
+        self._debris_expiry = []  # (release_time, debris) swept by tick()
+
+        # Compile the collision kernels now rather than on the first shot
+        warm_up()
+
+    def _make_projectile_pool(self, weapon):
+        """Create the entity pool for one weapon's projectile visuals."""
+        pool = EntityPool(
+            lambda: Projectile(weapon=weapon, pool=pool),
+            Projectile.reinit,
+            on_release=self._forget
+        )
+        return pool
+
+    def _forget(self, proj):
+        """Drop a released projectile from the active table and its slot."""
+        if self.projectiles.get(proj.projectile_id) is proj:
+            del self.projectiles[proj.projectile_id]
+        self._free_slot(proj)
+
+    def _soa_arrays(self):
+        return (self._pos, self._dir, self._speed, self._spawn_time, self._lifetime,
+                self._radius, self._hit_bonus, self._owner)
+
+    def _add_slot(self, proj):
+        """Copy a freshly spawned projectile's flight state into the next slot."""
+        slot = self._count
+        if slot == len(self._speed):
+            self._grow()
+        pos = proj.position
+        self._pos[slot] = (pos.x, pos.y, pos.z)
+        self._dir[slot] = (proj.dir_x, proj.dir_y, proj.dir_z)
+        self._speed[slot] = proj.speed
+        self._spawn_time[slot] = proj.spawn_time
+        self._lifetime[slot] = proj.lifetime
+        self._radius[slot] = proj.proj_radius
+        self._hit_bonus[slot] = _HIT_RADIUS.get(proj.weapon, 1.0)
+        self._owner[slot] = -1 if proj.owner_id is None else proj.owner_id
+        proj.slot = slot
+        self._slot_proj.append(proj)
+        self._count += 1
+
+    def _free_slot(self, proj):
+        """Release a projectile's slot, moving the last slot into the hole."""
+        slot = proj.slot
+        if slot is None:
+            return
+        last = self._count - 1
+        if slot != last:
+            for arr in self._soa_arrays():
+                arr[slot] = arr[last]
+            moved = self._slot_proj[last]
+            self._slot_proj[slot] = moved
+            moved.slot = slot
+        self._slot_proj.pop()
+        self._count = last
+        proj.slot = None
+
+    def _grow(self):
+        """Double the capacity of the flight arrays."""
+        (self._pos, self._dir, self._speed,
+         self._spawn_time, self._lifetime, self._radius,
+         self._hit_bonus, self._owner) = (
+            np.concatenate((arr, np.zeros_like(arr))) for arr in self._soa_arrays()
+        )
 
-    def set_collidables(self, collidables):
-        """Set the list of collidable obstacles."""
+    def tick(self, dt, now=None):
+        """Advance all projectiles once per frame with a single clock read.
+
+        Integration and lifetime expiry run as one vectorized step over the
+        flight arrays; results are then written back to the entities.
+        now defaults to time.time(), read once here for every projectile.
+        """
+        if now is None:
+            now = time.time()
+        self._now = now
+        if self._debris_expiry:
+            self._sweep_debris(now)
+
+        n = self._count
+        if not n:
+            return
+
+        pos = self._pos[:n]
+        delta = self._dir[:n] * (self._speed[:n] * dt)[:, None]
+        origin = pos.copy()
+        pos += delta
+        expired = ((now - self._spawn_time[:n]) > self._lifetime[:n]).tolist()
+
+        # Sweep the segment travelled this frame against the obstacle AABBs -
+        # fast bolts move many times their own radius per frame, so testing
+        # only the end point would let them tunnel through thin cover
+        if self._obs_grid:
+            radius = self._radius[:n]
+            if self.arena_bounds is None:
+                proj_idx, obs_idx = self._obstacle_pairs(origin, pos, radius)
+            else:
+                # Bolts that already left the arena are removed by check_collisions;
+                # only sweep the ones still inside
+                inside = np.flatnonzero((np.abs(origin) <= self.arena_bounds).all(axis=1))
+                proj_idx, obs_idx = self._obstacle_pairs(
+                    origin[inside], pos[inside], radius[inside]
+                )
+                proj_idx = inside[proj_idx]
+            t_hit = sweep_aabbs(
+                origin, delta, radius, self._obs_min, self._obs_max, proj_idx, obs_idx
+            )
+            hit_points = (origin + delta * np.minimum(t_hit, 1.0)[:, None]).tolist()
+            t_hit = t_hit.tolist()
+        else:
+            t_hit = hit_points = [math.inf] * n
+
+        # Snapshot the slot table - despawning below reorders slots
+        for proj, cur, t, hit_point, dead in zip(
+                list(self._slot_proj), pos.tolist(), t_hit, hit_points, expired):
+            if not proj.active:
+                continue
+            # Straight to the NodePath - skips Entity's position setter and Vec3
+            proj.setPos(*cur)
+
+            # Obstacle hit - set flag but don't despawn (let check_collisions handle it)
+            if t != math.inf:
+                proj.hit_obstacle = True
+                proj.hit_position = tuple(hit_point)
+            elif dead:
+                proj.despawn()
+
+    def _sweep_and_prune(self, player_lo, player_hi):
+        """Broad phase: pair projectile slots with players overlapping on x.
+
+        Projectile intervals are x +/- hit bonus, player intervals are given as
+        x +/- collision radius. All intervals are sorted by their start and
+        swept once, keeping an active list per side.
+        Returns {slot: [player_index, ...]} with indices in player order.
+        """
+        n = self._count
+        xs = self._pos[:n, 0]
+        bonus = self._hit_bonus[:n]
+        starts = np.concatenate((xs - bonus, player_lo))
+        ends = (xs + bonus).tolist() + list(player_hi)
+
+        candidates = {}
+        active_proj = []
+        active_players = []
+        for k, start in zip(np.argsort(starts, kind='stable').tolist(), np.sort(starts).tolist()):
+            if k < n:
+                active_players = [j for j in active_players if ends[j] >= start]
+                if active_players:
+                    candidates[k] = [j - n for j in active_players]
+                active_proj.append(k)
+            else:
+                active_proj = [i for i in active_proj if ends[i] >= start]
+                for i in active_proj:
+                    candidates.setdefault(i, []).append(k - n)
+                active_players.append(k)
+
+        for pairs in candidates.values():
+            pairs.sort()
+        return candidates
+
+    def _sweep_debris(self, now):
+        """Return debris whose animation has finished to the pool."""
+        pending = []
+        for entry in self._debris_expiry:
+            if now >= entry[0]:
+                self._debris_pool.release(entry[1])
+            else:
+                pending.append(entry)
+        self._debris_expiry = pending
+
+    def set_collidables(self, collidables, arena_bounds=None):
+        """Set the list of collidable obstacles and, optionally, the arena half-extents."""
         self.collidables = collidables
+        self.arena_bounds = arena_bounds
+        self.refresh_obstacles()
+
+    def refresh_obstacles(self):
+        """Rebuild the cached obstacle AABBs.
 
-    def spawn(self, position, direction, owner_id, projectile_id=None, weapon='primary'):
+        Obstacles are static, so their bounds are computed once here instead of
+        per projectile per frame. Call again after moving, resizing or
+        enabling/disabling an obstacle.
+        """
+        centers = []
+        halves = []
+        for obstacle in self.collidables:
+            if not obstacle.enabled:
+                continue
+            obs_pos = obstacle.world_position
+            obs_scale = obstacle.scale
+            centers.append((obs_pos.x, obs_pos.y, obs_pos.z))
+            halves.append((obs_scale.x / 2, obs_scale.y / 2, obs_scale.z / 2))
+
+        centers = np.array(centers, dtype=np.float32).reshape(-1, 3)
+        halves = np.array(halves, dtype=np.float32).reshape(-1, 3)
+        self._obs_min = centers - halves
+        self._obs_max = centers + halves
+
+        # Uniform grid: cell -> indices of the obstacles overlapping it. Big
+        # boxes (walls, floor) land in many cells, small ones in one or two.
+        self._obs_grid = {}
+        lo_cells = np.floor(self._obs_min / _OBSTACLE_CELL).astype(np.int64).tolist()
+        hi_cells = np.floor(self._obs_max / _OBSTACLE_CELL).astype(np.int64).tolist()
+        for idx, (lo, hi) in enumerate(zip(lo_cells, hi_cells)):
+            for ix in range(lo[0], hi[0] + 1):
+                for iy in range(lo[1], hi[1] + 1):
+                    for iz in range(lo[2], hi[2] + 1):
+                        self._obs_grid.setdefault((ix, iy, iz), []).append(idx)
+
+    def _obstacle_pairs(self, start, end, radius):
+        """Broad phase: (projectile, obstacle) index pairs sharing a grid cell.
+
+        Each segment's bounds, grown by the projectile radius, are mapped to
+        grid cells; only obstacles found in those cells are swept.
+        """
+        lo_cells = np.floor(
+            (np.minimum(start, end) - radius[:, None]) / _OBSTACLE_CELL
+        ).astype(np.int64).tolist()
+        hi_cells = np.floor(
+            (np.maximum(start, end) + radius[:, None]) / _OBSTACLE_CELL
+        ).astype(np.int64).tolist()
+
+        grid = self._obs_grid
+        proj_idx = []
+        obs_idx = []
+        for i, (lo, hi) in enumerate(zip(lo_cells, hi_cells)):
+            seen = set()
+            for ix in range(lo[0], hi[0] + 1):
+                for iy in range(lo[1], hi[1] + 1):
+                    for iz in range(lo[2], hi[2] + 1):
+                        cell = grid.get((ix, iy, iz))
+                        if cell:
+                            seen.update(cell)
+            proj_idx.extend([i] * len(seen))
+            obs_idx.extend(seen)
+        return np.array(proj_idx, dtype=np.int64), np.array(obs_idx, dtype=np.int64)
+
+    def spawn(self, position, direction, owner_id, projectile_id=None, weapon='primary',
+              normalized=False):
         """Create a new projectile."""
         if projectile_id is None:
             projectile_id = self.next_id
             self.next_id += 1
+        old = self.projectiles.get(projectile_id)
+        if old is not None:
+            # Local and server-assigned ids share one range; retire the bolt
+            # being replaced so it can't keep flying without a dict entry
+            old.despawn()
 
-        # Different stats for each weapon type (speeds 3x faster)
-        if weapon == 'secondary':
-            speed = 350  # Faster missile
-            damage = 100  # Direct hit kills (100 = full health)
-            lifetime = 10.0  # Much longer range
-        elif weapon == 'spreadshot':
-            speed = 195  # Medium speed (was 65)
-            damage = 8  # Less damage per projectile (but 3 projectiles)
-            lifetime = 2.0  # Medium range
-        else:
-            speed = 3500  # Ultra fast laser (5x faster)
-            damage = 12  # Less damage
-            lifetime = 1.5
+        speed, damage, lifetime = _WEAPON_STATS.get(weapon, _WEAPON_STATS['primary'])
+
+        pool = self._pools.get(weapon)
+        if pool is None:
+            pool = self._pools[weapon] = self._make_projectile_pool(weapon)
 
-        proj = Projectile(
+        proj = pool.acquire(
             position=position,
             direction=direction,
             owner_id=owner_id,
@@ -223,219 +547,245 @@ class ProjectileManager:
             speed=speed,
             damage=damage,
             lifetime=lifetime,
-            weapon=weapon,
-            collidables=self.collidables
+            normalized=normalized
         )
         self.projectiles[projectile_id] = proj
+        self._add_slot(proj)
         return proj
 
+    def spawn_many(self, positions, directions, owner_id, weapon='primary'):
+        """Create one projectile per (position, direction) pair, e.g. a spread volley.
+
+        Directions are normalized together in one NumPy step and handed to
+        spawn() as already unit length.
+        """
+        directions = np.asarray(directions, dtype=np.float64).reshape(-1, 3)
+        norms = np.sqrt((directions * directions).sum(axis=1, keepdims=True))
+        unit = (directions / np.maximum(norms, 1e-8)).tolist()
+        return [
+            self.spawn(position, direction, owner_id, weapon=weapon, normalized=True)
+            for position, direction in zip(positions, unit)
+        ]
+
     def create_explosion(self, position, size=3.0):
         """Create an explosion effect at position."""
-        exp = Explosion(position=position, size=size)
+        position = Vec3(*position)
+        exp = self._explosion_pool.acquire(position=position, size=size)
         self.explosions.append(exp)
 
-        # Create particle-like debris
-        for _ in range(8):
-            debris = Entity(
-                model='cube',
-                color=Color(255/255, random.randint(100, 200)/255, 50/255, 1),
-                scale=random.uniform(0.1, 0.3),
-                position=position
+        # Create particle-like debris - random values for all cubes drawn at once
+        count = _DEBRIS_PER_EXPLOSION
+        directions = np.random.uniform(-1, 1, (count, 3))
+        directions /= np.linalg.norm(directions, axis=1)[:, None]
+        speeds = np.random.uniform(5, 15, count)
+        targets = (np.array((position.x, position.y, position.z))
+                   + directions * speeds[:, None]).tolist()
+        durations = np.random.uniform(0.3, 0.6, count).tolist()
+        greens = np.random.randint(100, 201, count).tolist()
+        scales = np.random.uniform(0.1, 0.3, count).tolist()
+
+        for target, duration, green, scale in zip(targets, durations, greens, scales):
+            debris = self._debris_pool.acquire(
+                position=position,
+                color=_debris_color(green),
+                scale=scale
             )
-            # Random direction
-            direction = Vec3(
-                random.uniform(-1, 1),
-                random.uniform(-1, 1),
-                random.uniform(-1, 1)
-            ).normalized()
-            speed = random.uniform(5, 15)
-            duration = random.uniform(0.3, 0.6)
-
             debris.animate_position(
-                position + direction * speed,
+                Vec3(*target),
                 duration=duration,
                 curve=curve.out_expo
             )
             debris.animate_scale(0, duration=duration)
-            debris.animate_color(color.rgba(255, 100, 50, 0), duration=duration)
-            invoke(lambda d=debris: destroy(d), delay=duration)
+            debris.animate_color(_DEBRIS_FADE, duration=duration)
+            self._debris_expiry.append((self._now + duration, debris))
 
         return exp
 
     def remove(self, projectile_id):
         """Remove a projectile by ID."""
-        if projectile_id in self.projectiles:
-            proj = self.projectiles[projectile_id]
-            if proj.active:
-                proj.despawn()
-            del self.projectiles[projectile_id]
+        proj = self.projectiles.pop(projectile_id, None)
+        if proj and proj.active:
+            proj.despawn()
 
     def check_collisions(self, players, local_player, arena_bounds):
         """Check projectile collisions with players and arena.
 
         Returns tuple: (player_hits, obstacle_hits)
-        - player_hits: list of dicts with projectile_id, target_id, attacker_id, damage, weapon
+        - player_hits: list of HitRecord tuples
         - obstacle_hits: list of dicts with position, weapon (for sound/effects)
         """
+        if not self._count:
+            # Nothing in flight - only finished explosions to drop
+            if self.explosions:
+                self.explosions = [e for e in self.explosions if e.active]
+            return [], []
+
         hits = []
         obstacle_hits = []
         to_remove = []
 
-        # Combine local player with remote players for collision checking
-        all_players = dict(players)
-        if local_player:
-            all_players[local_player.player_id] = local_player
+        # Candidate targets: live remote players plus the local player, read
+        # straight from the caller's dict rather than merged into a copy
+        local_id = local_player.player_id if local_player else None
+        alive_players = [p for pid, p in players.items() if p.is_alive and pid != local_id]
+        if local_player and local_player.is_alive:
+            alive_players.append(local_player)
+        alive_pos = [(p.x, p.y, p.z) for p in alive_players]
+        # Use player's collision_radius if available, otherwise default
+        alive_radius = [getattr(p, 'collision_radius', 10.0) for p in alive_players]
+        # Array copies for the vectorized splash scan and the compiled kernel
+        alive_xyz = np.array(alive_pos, dtype=np.float32).reshape(-1, 3)
+        alive_ids = np.array([p.player_id for p in alive_players], dtype=np.int64)
+
+        # Broad phase; only surviving pairs get the full distance test below
+        candidates = {}
+        if alive_players and NUMBA_AVAILABLE:
+            # Compiled kernel over the flight arrays yields at most one pair per
+            # slot. Player data goes in as float64 so its distance test matches
+            # the one below exactly and no hit is lost on the boundary.
+            n = self._count
+            hit_idx = first_player_hits(
+                self._pos[:n], self._hit_bonus[:n], self._owner[:n],
+                np.array(alive_pos, dtype=np.float64).reshape(-1, 3),
+                np.array(alive_radius, dtype=np.float64), alive_ids,
+            ).tolist()
+            candidates = {slot: [idx] for slot, idx in enumerate(hit_idx) if idx >= 0}
+        elif alive_players:
+            candidates = self._sweep_and_prune(
+                [pos[0] - r for pos, r in zip(alive_pos, alive_radius)],
+                [pos[0] + r for pos, r in zip(alive_pos, alive_radius)],
+            )
 
-        for proj_id, proj in list(self.projectiles.items()):
-            if not proj.active:
-                to_remove.append(proj_id)
-                continue
+        # Walk the slot table with positions read from the flight arrays in one
+        # go. Despawns are deferred to to_remove, so the table is stable here.
+        positions = self._pos[:self._count].tolist()
+        for slot, proj in enumerate(self._slot_proj):
+            proj_id = proj.projectile_id
+            is_explosive = proj.weapon in _EXPLOSIVE_WEAPONS
 
-            # Check if projectile hit an obstacle (set by projectile's update)
+            # Check if projectile hit an obstacle (set by tick's swept AABB test)
             if proj.hit_obstacle:
                 obstacle_hits.append({
                     'position': proj.hit_position,
                     'weapon': proj.weapon
                 })
-                to_remove.append(proj_id)
+                to_remove.append(proj)
 
                 # Create explosion for secondary weapon hitting obstacles (3x bigger)
-                if proj.weapon == 'secondary':
+                if is_explosive:
                     self.create_explosion(proj.hit_position, size=72.0)
                     # Splash damage to nearby players
-                    splash_radius = 15.0
-                    splash_damage = proj.damage * 0.5
-                    for player in all_players.values():
-                        if player.player_id == proj.owner_id:
-                            continue
-                        if not player.is_alive:
-                            continue
-                        splash_dist = (player.position - proj.hit_position).length()
-                        if splash_dist < splash_radius:
-                            damage_mult = 1.0 - (splash_dist / splash_radius)
-                            actual_damage = int(splash_damage * damage_mult)
-                            if actual_damage > 0:
-                                hits.append({
-                                    'projectile_id': proj_id,
-                                    'target_id': player.player_id,
-                                    'attacker_id': proj.owner_id,
-                                    'damage': actual_damage,
-                                    'weapon': 'splash',
-                                    'position': proj.hit_position
-                                })
+                    self._apply_splash(proj, proj.hit_position, alive_players, alive_xyz, alive_ids, hits)
                 continue
 
             # Check arena bounds
-            pos = proj.position
+            x, y, z = positions[slot]
+            hit_pos = (x, y, z)
             hit_wall = False
-            if (abs(pos.x) > arena_bounds[0] or
-                abs(pos.y) > arena_bounds[1] or
-                abs(pos.z) > arena_bounds[2]):
+            if (abs(x) > arena_bounds[0] or
+                abs(y) > arena_bounds[1] or
+                abs(z) > arena_bounds[2]):
                 hit_wall = True
-                to_remove.append(proj_id)
+                to_remove.append(proj)
 
                 # Create explosion for secondary weapon hitting walls (3x bigger)
-                if proj.weapon == 'secondary':
-                    self.create_explosion(pos, size=72.0)
+                if is_explosive:
+                    self.create_explosion(hit_pos, size=72.0)
                     obstacle_hits.append({
-                        'position': Vec3(pos),
+                        'position': hit_pos,
                         'weapon': proj.weapon
                     })
                     # Splash damage to nearby players
-                    splash_radius = 15.0
-                    splash_damage = proj.damage * 0.5
-                    for player in all_players.values():
-                        if player.player_id == proj.owner_id:
-                            continue
-                        if not player.is_alive:
-                            continue
-                        splash_dist = (player.position - pos).length()
-                        if splash_dist < splash_radius:
-                            damage_mult = 1.0 - (splash_dist / splash_radius)
-                            actual_damage = int(splash_damage * damage_mult)
-                            if actual_damage > 0:
-                                hits.append({
-                                    'projectile_id': proj_id,
-                                    'target_id': player.player_id,
-                                    'attacker_id': proj.owner_id,
-                                    'damage': actual_damage,
-                                    'weapon': 'splash',
-                                    'position': Vec3(pos)
-                                })
+                    self._apply_splash(proj, hit_pos, alive_players, alive_xyz, alive_ids, hits)
                 continue
 
             # Check player collisions
-            for player in all_players.values():
-                if player.player_id == proj.owner_id:
+            # Add projectile radius for larger projectiles
+            proj_bonus = _HIT_RADIUS.get(proj.weapon, 1.0)
+
+            # Distance-based collision against the broad-phase candidates
+            player = None
+            for idx in candidates.get(slot, ()):
+                target = alive_players[idx]
+                if target.player_id == proj.owner_id:
                     continue
-                if not player.is_alive:
-                    continue
-
-                # Distance-based collision using target's collision radius
-                dist = (player.position - proj.position).length()
-                # Use player's collision_radius if available, otherwise default
-                target_radius = getattr(player, 'collision_radius', 10.0)
-                # Add projectile radius for larger projectiles
-                proj_bonus = 2.0 if proj.weapon == 'secondary' else 1.0
-                hit_radius = target_radius + proj_bonus
-
-                if dist < hit_radius:
-                    hits.append({
-                        'projectile_id': proj_id,
-                        'target_id': player.player_id,
-                        'attacker_id': proj.owner_id,
-                        'damage': proj.damage,
-                        'weapon': proj.weapon,
-                        'position': Vec3(proj.position)
-                    })
-                    to_remove.append(proj_id)
-
-                    # Create explosion for secondary weapon (3x bigger) with splash damage
-                    if proj.weapon == 'secondary':
-                        self.create_explosion(proj.position, size=84.0)  # 3x bigger explosion
-                        # Splash damage to nearby players
-                        splash_radius = 15.0
-                        splash_damage = proj.damage * 0.5  # 50% damage for splash
-                        for other_player in all_players.values():
-                            if other_player.player_id == player.player_id:
-                                continue  # Already hit directly
-                            if other_player.player_id == proj.owner_id:
-                                continue  # Don't damage self
-                            if not other_player.is_alive:
-                                continue
-                            splash_dist = (other_player.position - proj.position).length()
-                            if splash_dist < splash_radius:
-                                # Damage falls off with distance
-                                damage_mult = 1.0 - (splash_dist / splash_radius)
-                                actual_damage = int(splash_damage * damage_mult)
-                                if actual_damage > 0:
-                                    hits.append({
-                                        'projectile_id': proj_id,
-                                        'target_id': other_player.player_id,
-                                        'attacker_id': proj.owner_id,
-                                        'damage': actual_damage,
-                                        'weapon': 'splash',
-                                        'position': Vec3(proj.position)
-                                    })
+                tx, ty, tz = alive_pos[idx]
+                dx = tx - x
+                dy = ty - y
+                dz = tz - z
+                reach = alive_radius[idx] + proj_bonus
+                if dx * dx + dy * dy + dz * dz < reach * reach:
+                    player = target
                     break
+            if player is not None:
+                hits.append(HitRecord(
+                    proj_id, player.player_id, proj.owner_id, proj.damage, proj.weapon, hit_pos
+                ))
+                to_remove.append(proj)
+
+                # Create explosion for secondary weapon (3x bigger) with splash damage
+                if is_explosive:
+                    self.create_explosion(hit_pos, size=84.0)  # 3x bigger explosion
+                    # Splash damage to nearby players
+                    self._apply_splash(proj, hit_pos, alive_players, alive_xyz, alive_ids, hits,
+                                       skip_id=player.player_id)
 
         # Clean up
-        for proj_id in to_remove:
-            self.remove(proj_id)
+        for proj in to_remove:
+            proj.despawn()
 
         # Clean up finished explosions
         self.explosions = [e for e in self.explosions if e.active]
 
         return hits, obstacle_hits
 
+    def _apply_splash(self, proj, center, alive_players, alive_xyz, alive_ids, hits,
+                      skip_id=None):
+        """Append splash HitRecords for live targets around center.
+
+        Splash deals 50% of the projectile's damage, falling off linearly to
+        zero at _SPLASH_RADIUS. The owner and skip_id (the direct-hit target)
+        take no splash. All targets are tested in one vectorized step.
+        """
+        if not alive_players:
+            return
+        delta = alive_xyz - center
+        dist_sq = (delta * delta).sum(axis=1)
+        owner = -1 if proj.owner_id is None else proj.owner_id
+        in_range = (dist_sq < _SPLASH_RADIUS_SQ) & (alive_ids != owner)
+        if skip_id is not None:
+            in_range &= alive_ids != skip_id
+        idxs = np.flatnonzero(in_range)
+        if not idxs.size:
+            return
+
+        splash_damage = proj.damage * 0.5
+        damages = (splash_damage * (1.0 - np.sqrt(dist_sq[idxs]) / _SPLASH_RADIUS)).astype(np.int64)
+        for idx, actual_damage in zip(idxs.tolist(), damages.tolist()):
+            if actual_damage > 0:
+                hits.append(HitRecord(
+                    proj.projectile_id, alive_players[idx].player_id, proj.owner_id,
+                    actual_damage, 'splash', center
+                ))
+
     def clear(self):
         """Remove all projectiles and explosions."""
-        for proj in list(self.projectiles.values()):
+        for proj in list(self._slot_proj):
             if proj.active:
                 proj.despawn()
         self.projectiles.clear()
 
         for exp in self.explosions:
-            if exp.active:
-                destroy(exp)
+            exp.cancel()
         self.explosions.clear()
+
+        for _, debris in self._debris_expiry:
+            self._debris_pool.release(debris)
+        self._debris_expiry.clear()
+
+    def destroy_pools(self):
+        """Destroy every pooled entity; call after clear() when the match ends."""
+        for pool in self._pools.values():
+            pool.clear()
+        self._explosion_pool.clear()
+        self._debris_pool.clear()
@@ -1,15 +1,70 @@
 """Automated testing framework for the game using screenshots."""
 import os
+import struct
 import sys
 import time
 import subprocess
 import threading
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
 
+try:
+    import Quartz
+    from CoreFoundation import CFURLCreateWithFileSystemPath, kCFURLPOSIXPathStyle
+    QUARTZ_AVAILABLE = True
+except ImportError:
+    QUARTZ_AVAILABLE = False
+
 # Test results directory
 TEST_DIR = Path(__file__).parent / "test_results"
-TEST_DIR.mkdir(exist_ok=True)
+_dir_ready = False
+
+PNG_SIGNATURE = b'\x89PNG\r\n\x1a\n'
+
+
+def _ensure_test_dir():
+    """Create TEST_DIR on first write rather than at import time."""
+    global _dir_ready
+    if not _dir_ready:
+        TEST_DIR.mkdir(parents=True, exist_ok=True)
+        _dir_ready = True
+
+
+def _capture_process_window(filepath, pid):
+    """Write the on-screen window owned by pid to filepath as a PNG via Quartz.
+
+    Returns False when that process has no normal window on screen, so the
+    caller can fall back to screencapture.
+    """
+    windows = Quartz.CGWindowListCopyWindowInfo(
+        Quartz.kCGWindowListOptionOnScreenOnly | Quartz.kCGWindowListExcludeDesktopElements,
+        Quartz.kCGNullWindowID,
+    )
+    # Layer 0 skips menu bar and overlays; match the game, not whatever
+    # window (terminal, IDE) happens to be in front
+    window_id = next((w['kCGWindowNumber'] for w in windows
+                      if w.get('kCGWindowOwnerPID') == pid
+                      and w.get('kCGWindowLayer') == 0), None)
+    if window_id is None:
+        return False
+
+    image = Quartz.CGWindowListCreateImage(
+        Quartz.CGRectNull,
+        Quartz.kCGWindowListOptionIncludingWindow,
+        window_id,
+        Quartz.kCGWindowImageBoundsIgnoreFraming,
+    )
+    if image is None:
+        return False
+
+    url = CFURLCreateWithFileSystemPath(None, str(filepath), kCFURLPOSIXPathStyle, False)
+    dest = Quartz.CGImageDestinationCreateWithURL(url, 'public.png', 1, None)
+    if dest is None:
+        return False
+    Quartz.CGImageDestinationAddImage(dest, image, None)
+    return bool(Quartz.CGImageDestinationFinalize(dest))
 
 
 class GameTester:
@@ -31,8 +86,9 @@ class GameTester:
         self.game_process = subprocess.Popen(
             [sys.executable, str(game_path)],
             env=env,
-            stdout=subprocess.PIPE,
-            stderr=subprocess.PIPE,
+            # Nothing reads these; a PIPE would stall the game once it fills
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
         )
         self.start_time = time.time()
         print(f"[TEST] Game started with PID {self.game_process.pid}")
@@ -46,24 +102,32 @@ class GameTester:
             print("[TEST] Game stopped")
 
     def take_screenshot(self, name_suffix=""):
-        """Take a screenshot using macOS screencapture."""
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S_%f")
-        filename = f"{self.test_name}_{timestamp}{name_suffix}.png"
+        """Take a screenshot of the game window."""
+        filename = f"{self.test_name}_{time.time_ns()}{name_suffix}.png"
         filepath = TEST_DIR / filename
-
-        # Use macOS screencapture to capture the frontmost window
-        result = subprocess.run(
-            ['screencapture', '-w', '-o', str(filepath)],
-            capture_output=True,
-            timeout=5
-        )
-
-        if result.returncode == 0 and filepath.exists():
+        _ensure_test_dir()
+
+        # Capture in-process through Quartz when we can, so a run of shots
+        # doesn't pay a screencapture fork each
+        captured = (QUARTZ_AVAILABLE and self.game_process is not None
+                    and _capture_process_window(filepath, self.game_process.pid))
+        error = ""
+        if not captured:
+            # Fall back to macOS screencapture
+            result = subprocess.run(
+                ['screencapture', '-w', '-o', str(filepath)],
+                capture_output=True,
+                timeout=5
+            )
+            captured = result.returncode == 0
+            error = result.stderr.decode()
+
+        if captured and filepath.exists():
             self.screenshots.append(filepath)
             print(f"[TEST] Screenshot saved: {filename}")
             return filepath
         else:
-            print(f"[TEST] Screenshot failed: {result.stderr.decode()}")
+            print(f"[TEST] Screenshot failed: {error}")
             return None
 
     def wait_and_screenshot(self, delay_ms, suffix=""):
@@ -71,6 +135,28 @@ class GameTester:
         time.sleep(delay_ms / 1000.0)
         return self.take_screenshot(suffix)
 
+    def take_screenshot_batch(self, delays_ms, suffix=""):
+        """Take one screenshot at each delay (ms), all measured from now.
+
+        Delays share a single start time instead of chaining sleeps, so a
+        slow capture doesn't push the later shots back.
+        """
+        start = time.monotonic()
+        shots = []
+        for delay_ms in sorted(delays_ms):
+            remaining = start + delay_ms / 1000.0 - time.monotonic()
+            if remaining > 0:
+                time.sleep(remaining)
+            shots.append(self.take_screenshot(f"{suffix}_{delay_ms}ms"))
+        return shots
+
+    def analyze_all(self):
+        """Analyze every screenshot taken so far, overlapping the file reads."""
+        if not self.screenshots:
+            return []
+        with ThreadPoolExecutor(max_workers=min(16, len(self.screenshots))) as pool:
+            return list(pool.map(analyze_screenshot, self.screenshots))
+
     def run_test(self, test_name, test_func):
         """Run a test with the given function."""
         self.test_name = test_name
@@ -160,46 +246,54 @@ def run_visual_test(test_name, actions, screenshot_times_ms):
 
     # Create test instructions file
     instructions_file = TEST_DIR / f"{test_name}_instructions.txt"
+    _ensure_test_dir()
+    lines = [
+        f"Test: {test_name}\n",
+        f"Time: {datetime.now()}\n\n",
+        "Actions to perform:\n",
+    ]
+    lines.extend(f"  At {time_ms}ms: {action}\n" for time_ms, action in actions)
+    lines.append(f"\nScreenshots will be taken at: {screenshot_times_ms}ms\n")
     with open(instructions_file, 'w') as f:
-        f.write(f"Test: {test_name}\n")
-        f.write(f"Time: {datetime.now()}\n\n")
-        f.write("Actions to perform:\n")
-        for time_ms, action in actions:
-            f.write(f"  At {time_ms}ms: {action}\n")
-        f.write(f"\nScreenshots will be taken at: {screenshot_times_ms}ms\n")
+        f.writelines(lines)
 
     print(f"[TEST] Instructions saved to {instructions_file}")
     return tester
 
 
+@lru_cache(maxsize=512)
+def _parse_png_header(path, mtime_ns, size):
+    """Read dimensions from a PNG header; mtime/size key the cache."""
+    header = bytearray(24)
+    with open(path, 'rb', buffering=0) as f:
+        got = f.readinto(header)
+    mv = memoryview(header)
+    if got < 24 or mv[:8] != PNG_SIGNATURE:
+        return {'error': 'Not a valid PNG'}
+
+    width, height = struct.unpack_from('>II', mv, 16)
+
+    return {
+        'width': width,
+        'height': height,
+        'file_size': size,
+        'path': path,
+    }
+
+
 def analyze_screenshot(filepath):
     """
     Analyze a screenshot to check for expected elements.
     Returns basic info about the image.
     """
-    if not os.path.exists(filepath):
+    try:
+        st = os.stat(filepath)
+    except FileNotFoundError:
         return {'error': 'File not found'}
 
-    import struct
-    import zlib
-
-    # Read PNG header to get dimensions
-    with open(filepath, 'rb') as f:
-        header = f.read(24)
-        if header[:8] != b'\x89PNG\r\n\x1a\n':
-            return {'error': 'Not a valid PNG'}
-
-        width = struct.unpack('>I', header[16:20])[0]
-        height = struct.unpack('>I', header[20:24])[0]
-
-    file_size = os.path.getsize(filepath)
-
-    return {
-        'width': width,
-        'height': height,
-        'file_size': file_size,
-        'path': str(filepath),
-    }
+    # Unchanged files are served from the cache; copy so callers can't
+    # mutate the cached entry
+    return dict(_parse_png_header(str(filepath), st.st_mtime_ns, st.st_size))
 
 
 if __name__ == "__main__":
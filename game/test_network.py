@@ -5,8 +5,8 @@ Run this to test the network layer without needing to manually start two game wi
 """
 import socket
 import threading
-import time
 import sys
+from concurrent.futures import ProcessPoolExecutor
 
 # Add parent directory to path for imports
 sys.path.insert(0, '/Users/zeratul/Developer/2026-01-28 - test michele/game')
@@ -28,8 +28,6 @@ def test_server_client_connection():
         return False
     print("Server started successfully")
 
-    time.sleep(0.5)
-
     # Connect client
     print("\n[2] Connecting client to 127.0.0.1:5555...")
     client = NetworkClient()
@@ -39,8 +37,6 @@ def test_server_client_connection():
         return False
     print(f"Client connected! Assigned player_id: {client.player_id}")
 
-    time.sleep(0.5)
-
     # Test sending player update from client
     print("\n[3] Client sending player state update...")
     test_state = {
@@ -51,11 +47,9 @@ def test_server_client_connection():
     }
     client.send_player_update(test_state)
 
-    time.sleep(0.3)
-
     # Server receives messages
     print("\n[4] Server checking for messages...")
-    messages = server.get_messages()
+    messages = server.wait_for_message(NetworkMessage.PLAYER_UPDATE)
     print(f"Server received {len(messages)} message(s)")
     for msg in messages:
         print(f"   Message type: {msg.get('type')}, player_id: {msg.get('player_id')}")
@@ -72,11 +66,9 @@ def test_server_client_connection():
     }
     server.broadcast_game_state({client.player_id: test_state}, host_state=host_state)
 
-    time.sleep(0.3)
-
     # Client receives messages
     print("\n[6] Client checking for messages...")
-    client_messages = client.get_messages()
+    client_messages = client.wait_for_message(NetworkMessage.PLAYER_UPDATE)
     print(f"Client received {len(client_messages)} message(s)")
     for msg in client_messages:
         print(f"   Message type: {msg.get('type')}")
@@ -91,10 +83,8 @@ def test_server_client_connection():
     }
     client.send_shoot(shot_data)
 
-    time.sleep(0.3)
-
     # Server receives shoot
-    messages = server.get_messages()
+    messages = server.wait_for_message(NetworkMessage.PROJECTILE_SPAWN)
     print(f"Server received {len(messages)} message(s)")
     for msg in messages:
         if msg.get('type') == NetworkMessage.PROJECTILE_SPAWN:
@@ -124,8 +114,6 @@ def test_multiple_clients():
         print("FAILED: Could not start server")
         return False
 
-    time.sleep(0.5)
-
     # Connect multiple clients
     clients = []
     for i in range(3):
@@ -137,8 +125,6 @@ def test_multiple_clients():
         else:
             print(f"   FAILED: Client {i+1} could not connect")
 
-    time.sleep(0.5)
-
     print(f"\n[5] Connected clients: {len(clients)}")
 
     # Cleanup
@@ -174,9 +160,11 @@ if __name__ == "__main__":
 
     print("\n")
 
-    # Run tests
-    test1 = test_server_client_connection()
-    test2 = test_multiple_clients()
+    # Run tests - they use separate ports, so run them side by side
+    with ProcessPoolExecutor(max_workers=2) as pool:
+        fut1 = pool.submit(test_server_client_connection)
+        fut2 = pool.submit(test_multiple_clients)
+        test1, test2 = fut1.result(), fut2.result()
 
     print("\n" + "=" * 50)
     print("SUMMARY")
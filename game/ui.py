@@ -1,6 +1,52 @@
 """HUD and menu UI components."""
+import math
+import re
+from functools import lru_cache
+
 from ursina import *
 
+# Shared colors; Entity.color keeps a reference, so one instance per shade
+_MENU_BG = color.rgb(20, 20, 30)
+_PANEL_BG = Color(30/255, 30/255, 40/255, 230/255)
+_DARK_RED = color.red.tint(-0.2)
+_DARK_GREEN = color.green.tint(-0.2)
+_BAR_BG = color.rgb(40, 40, 40)
+_SHIELD_COLOR = color.rgb(150, 50, 255)  # Purple for shield
+_SPEED_COLOR = color.rgb(100, 200, 255)
+_DEATH_BG = Color(0, 0, 0, 150/255)
+_DEATH_TEXT_STYLE = dict(scale=4, origin=(0, 0), y=0.1, color=color.red)
+
+_MAIN_BUTTON_STYLE = dict(scale=(0.3, 0.08))
+
+_IP_RE = re.compile(r'\d{1,3}(?:\.\d{1,3}){3}')
+
+# Health bar color by ceil(10 * health ratio): red up to 30%, yellow up to 60%
+_HEALTH_COLORS = tuple(
+    color.red if i <= 3 else color.yellow if i <= 6 else color.green
+    for i in range(11)
+)
+
+# Crosshair as one mesh: (half width, half height) of the center dot and
+# the horizontal and vertical bars, each wound like Ursina's quad
+_CROSSHAIR_RECTS = ((0.004, 0.004), (0.01, 0.001), (0.001, 0.01))
+_CROSSHAIR_VERTS = tuple(
+    (sx * w, sy * h, 0)
+    for w, h in _CROSSHAIR_RECTS
+    for sx, sy in ((-1, -1), (1, -1), (1, 1), (-1, 1))
+)
+_CROSSHAIR_QUADS = tuple(tuple(range(i, i + 4)) for i in range(0, len(_CROSSHAIR_VERTS), 4))
+
+
+# Speed and K/D revisit the same small set of values, so keep their labels
+@lru_cache(maxsize=1024)
+def _fmt_speed(speed):
+    return f'SPD: {speed}'
+
+
+@lru_cache(maxsize=256)
+def _fmt_stats(kills, deaths):
+    return f'K: {kills}  D: {deaths}'
+
 
 class MainMenu(Entity):
     """Main menu with Host/Join/Quit options."""
@@ -16,7 +62,7 @@ class MainMenu(Entity):
         self.bg = Entity(
             parent=self,
             model='quad',
-            color=color.rgb(20, 20, 30),
+            color=_MENU_BG,
             scale=(2, 1),
             z=1
         )
@@ -41,36 +87,34 @@ class MainMenu(Entity):
         )
 
         # Buttons
-        button_scale = (0.3, 0.08)
-
         self.host_button = Button(
             parent=self,
             text='HOST GAME',
-            scale=button_scale,
             y=0.05,
             color=color.azure,
             highlight_color=color.cyan,
-            on_click=self._on_host_click
+            on_click=self._on_host_click,
+            **_MAIN_BUTTON_STYLE
         )
 
         self.join_button = Button(
             parent=self,
             text='JOIN GAME',
-            scale=button_scale,
             y=-0.08,
             color=color.orange,
             highlight_color=color.yellow,
-            on_click=self._on_join_click
+            on_click=self._on_join_click,
+            **_MAIN_BUTTON_STYLE
         )
 
         self.quit_button = Button(
             parent=self,
             text='QUIT',
-            scale=button_scale,
             y=-0.21,
-            color=color.red.tint(-0.2),
+            color=_DARK_RED,
             highlight_color=color.red,
-            on_click=self._on_quit_click
+            on_click=self._on_quit_click,
+            **_MAIN_BUTTON_STYLE
         )
 
         # Controls info
@@ -111,11 +155,17 @@ class JoinDialog(Entity):
         self.on_cancel = on_cancel
         self.default_ip = default_ip
 
+        # Hosts never open this dialog, so its widgets wait for show()
+        self._built = False
+        self.enabled = False
+
+    def _build(self):
+        """Create the dialog widgets on first show."""
         # Background panel
         self.panel = Entity(
             parent=self,
             model='quad',
-            color=Color(30/255, 30/255, 40/255, 230/255),
+            color=_PANEL_BG,
             scale=(0.5, 0.35),
             z=0.1
         )
@@ -156,7 +206,7 @@ class JoinDialog(Entity):
             text='CONNECT',
             scale=(0.15, 0.05),
             position=(-0.09, -0.11),
-            color=color.green.tint(-0.2),
+            color=_DARK_GREEN,
             highlight_color=color.green,
             on_click=self._on_connect_click
         )
@@ -166,28 +216,30 @@ class JoinDialog(Entity):
             text='CANCEL',
             scale=(0.15, 0.05),
             position=(0.09, -0.11),
-            color=color.red.tint(-0.2),
+            color=_DARK_RED,
             highlight_color=color.red,
             on_click=self._on_cancel_click
         )
-
-        self.enabled = False
+        self._built = True
 
     def _on_connect_click(self):
         ip = self.ip_input.text.strip()
-        if ip:
+        if _IP_RE.fullmatch(ip):
             self.on_connect(ip)
 
     def _on_cancel_click(self):
         self.on_cancel()
 
     def show(self):
+        if not self._built:
+            self._build()
         self.enabled = True
         self.ip_input.active = True
 
     def hide(self):
         self.enabled = False
-        self.ip_input.active = False
+        if self._built:
+            self.ip_input.active = False
 
 
 class HUD(Entity):
@@ -200,7 +252,7 @@ class HUD(Entity):
         self.health_bg = Entity(
             parent=self,
             model='quad',
-            color=color.rgb(40, 40, 40),
+            color=_BAR_BG,
             scale=(0.3, 0.03),
             position=(-0.55, -0.42),
             origin=(-0.5, 0)
@@ -231,7 +283,7 @@ class HUD(Entity):
         self.shield_bg = Entity(
             parent=self,
             model='quad',
-            color=color.rgb(40, 40, 40),
+            color=_BAR_BG,
             scale=(0.3, 0.02),
             position=(-0.55, -0.46),
             origin=(-0.5, 0)
@@ -241,7 +293,7 @@ class HUD(Entity):
         self.shield_bar = Entity(
             parent=self,
             model='quad',
-            color=color.rgb(150, 50, 255),  # Purple for shield
+            color=_SHIELD_COLOR,
             scale=(0, 0.015),  # Start at 0 width
             position=(-0.55, -0.46),
             origin=(-0.5, 0),
@@ -275,27 +327,14 @@ class HUD(Entity):
             scale=1,
             position=(-0.55, -0.35),
             origin=(-0.5, 0),
-            color=color.rgb(100, 200, 255)
+            color=_SPEED_COLOR
         )
 
         # Crosshair
         self.crosshair = Entity(
             parent=self,
-            model='quad',
-            color=color.white,
-            scale=0.008
-        )
-        self.crosshair_h = Entity(
-            parent=self,
-            model='quad',
-            color=color.white,
-            scale=(0.02, 0.002)
-        )
-        self.crosshair_v = Entity(
-            parent=self,
-            model='quad',
-            color=color.white,
-            scale=(0.002, 0.02)
+            model=Mesh(vertices=list(_CROSSHAIR_VERTS), triangles=list(_CROSSHAIR_QUADS)),
+            color=color.white
         )
 
         # Message display
@@ -307,7 +346,7 @@ class HUD(Entity):
             origin=(0, 0),
             color=color.yellow
         )
-        self.message_timer = 0
+        self._message_hide = None  # Pending invoke() that clears the message
 
         # Server info
         self.server_info = Text(
@@ -319,54 +358,94 @@ class HUD(Entity):
             color=color.light_gray
         )
 
+        # Last values shown, so per-frame updates skip unchanged text;
+        # the Text setter rebuilds its glyph geometry on every assignment
+        self._last_health = None
+        self._health_q = None
+        self._health_color = None
+        self._shield_q = None
+        self._last_stats = None
+        self._last_speed = None
+        self._last_count = None
+        self._last_info = None
+
         self.enabled = False
 
     def update_health(self, health, max_health=100):
         """Update health bar display."""
         ratio = max(0, health / max_health)
-        self.health_bar.scale_x = 0.3 * ratio
-        self.health_text.text = str(int(health))
+        # Bars only move in 1/300 steps of their full width, below a pixel;
+        # each scale write recomputes the entity's transform
+        bar_q = int(ratio * 300)
+        if bar_q != self._health_q:
+            self._health_q = bar_q
+            self.health_bar.scale_x = 0.3 * ratio
+
+        hp = int(health)
+        if hp != self._last_health:
+            self._last_health = hp
+            self.health_text.text = str(hp)
 
         # Color based on health
-        if ratio > 0.6:
-            self.health_bar.color = color.green
-        elif ratio > 0.3:
-            self.health_bar.color = color.yellow
-        else:
-            self.health_bar.color = color.red
+        bucket = min(10, max(0, math.ceil(health * 10 / max_health)))
+        if bucket != self._health_color:
+            self._health_color = bucket
+            self.health_bar.color = _HEALTH_COLORS[bucket]
 
     def update_shield(self, shield, max_shield=100):
         """Update shield bar display."""
         ratio = max(0, shield / max_shield)
+        bar_q = int(ratio * 300)
+        if bar_q == self._shield_q:
+            return
+        self._shield_q = bar_q
         self.shield_bar.scale_x = 0.3 * ratio
 
     def update_stats(self, kills, deaths):
         """Update kill/death display."""
-        self.stats_text.text = f'K: {kills}  D: {deaths}'
+        if (kills, deaths) == self._last_stats:
+            return
+        self._last_stats = (kills, deaths)
+        self.stats_text.text = _fmt_stats(kills, deaths)
 
     def update_speed(self, speed):
         """Update speed display."""
-        self.speed_text.text = f'SPD: {int(speed)}'
+        speed = int(speed)
+        if speed == self._last_speed:
+            return
+        self._last_speed = speed
+        self.speed_text.text = _fmt_speed(speed)
 
     def update_player_count(self, count):
         """Update player count display."""
+        if count == self._last_count:
+            return
+        self._last_count = count
         self.player_count.text = f'Players: {count}'
 
     def show_message(self, text, duration=3.0):
         """Show a temporary message."""
         self.message.text = text
-        self.message_timer = duration
+        if self._message_hide:
+            self._message_hide.kill()
+        self._message_hide = invoke(self._clear_message, delay=duration)
+        if self._message_hide:
+            # Count down only while the HUD is shown, and drop the sequence
+            # once it fires
+            self._message_hide.entity = self
+            self._message_hide.auto_destroy = True
+
+    def _clear_message(self):
+        self.message.text = ''
+        self._message_hide = None
 
     def set_server_info(self, ip, port):
         """Show server IP for host."""
-        self.server_info.text = f'Hosting: {ip}:{port}'
-
-    def update(self):
-        """Update message timer."""
-        if self.message_timer > 0:
-            self.message_timer -= time.dt
-            if self.message_timer <= 0:
-                self.message.text = ''
+        info = f'Hosting: {ip}:{port}'
+        if info == self._last_info:
+            return
+        self._last_info = info
+        self.server_info.text = info
 
     def show(self):
         self.enabled = True
@@ -381,22 +460,24 @@ class RespawnScreen(Entity):
     def __init__(self):
         super().__init__(parent=camera.ui)
 
+        # Built on the first death rather than at startup
+        self._built = False
+        self.enabled = False
+
+    def _build(self):
+        """Create the overlay widgets on first show."""
         self.bg = Entity(
             parent=self,
             model='quad',
-            color=Color(0, 0, 0, 150/255),
+            color=_DEATH_BG,
             scale=(2, 1),
             z=0.1
         )
 
-        self.text = Text(
-            parent=self,
-            text='YOU DIED',
-            scale=4,
-            origin=(0, 0),
-            y=0.1,
-            color=color.red
-        )
+        self.text = Text(parent=self, text='YOU DIED', **_DEATH_TEXT_STYLE)
+        # One prebuilt Text per killer, so repeat deaths don't reshape glyphs
+        self._killer_texts = {}
+        self._shown_text = self.text
 
         self.respawn_text = Text(
             parent=self,
@@ -406,15 +487,26 @@ class RespawnScreen(Entity):
             y=-0.05,
             color=color.white
         )
-
-        self.enabled = False
+        self._built = True
 
     def show(self, killer_name=None):
+        if not self._built:
+            self._build()
         self.enabled = True
-        if killer_name:
-            self.text.text = f'Killed by Player {killer_name}'
-        else:
-            self.text.text = 'YOU DIED'
+
+        shown = self._killer_text(killer_name) if killer_name else self.text
+        if shown is not self._shown_text:
+            self._shown_text.enabled = False
+            shown.enabled = True
+            self._shown_text = shown
+
+    def _killer_text(self, killer_name):
+        text = self._killer_texts.get(killer_name)
+        if text is None:
+            text = Text(parent=self, text=f'Killed by Player {killer_name}',
+                        enabled=False, **_DEATH_TEXT_STYLE)
+            self._killer_texts[killer_name] = text
+        return text
 
     def hide(self):
         self.enabled = False